@@ -1,7 +1,6 @@
 import time
 import numpy as np
 import string
-import random
 from pyneatR import nnumber, npercent, ndate, ntimestamp, nstring, nday
 
 def benchmark(name, func, data, **kwargs):
@@ -45,17 +44,11 @@ def run_benchmarks():
     # If standard unique_optimization is assumed, we should test with some dups.
     
     unique_count = 10000
-    # Create 10k random strings
-    params = list(string.ascii_letters + " !@#")
-    # This generation is slow in python, so let's keep it simple.
-    chars = np.array(list(string.ascii_letters), dtype='U1')
-    # Generate 10k words of length 10
-    # vectorized random choice
-    # indices = np.random.randint(0, len(chars), (unique_count, 10))
-    # words = "".join... too complex.
-    
-    # Simple list comp
-    vocab = ["".join(random.choices(string.ascii_letters + "  !@#", k=10)) for _ in range(unique_count)]
+    # Draw 10k words of length 10 in one shot: random byte indices into the
+    # alphabet, reinterpreted as fixed-width byte strings
+    chars = np.frombuffer((string.ascii_letters + "  !@#").encode(), dtype=np.uint8)
+    idx = np.random.randint(0, len(chars), (unique_count, 10), dtype=np.int32)
+    vocab = np.frombuffer(chars[idx].tobytes(), dtype='S10').astype('U10')
     
     # Now sample N from vocab
     strings_data = np.random.choice(vocab, N)
@@ -1,29 +1,94 @@
 import numpy as np
 import datetime
-from .utils import _check_singleton, _unique_optimization
-from typing import Union
+from .utils import _check_singleton, _unique_optimization, _str_concat
+from typing import Union, Optional
 
-def _get_weekday_name_vec(dt64: np.ndarray) -> np.ndarray:
+_MONTHS_ARR = np.array(["", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+_WEEKDAY_ARR = np.array(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
+_TWO_DIGITS = np.array([f"{i:02d}" for i in range(100)])
+_AMPM_ARR = np.array([" AM", " PM"])
+
+# Relative-day aliases indexed by clip(today - date + 9, 0, 18)
+_REL_DAY_OFFSET = 9
+_REL_DAY_LABELS = np.array([""] + ["Coming "] * 7 + ["Tomorrow, ", "Today, ", "Yesterday, "]
+                           + ["Last "] * 7 + [""])
+# Full "<alias><weekday>" strings indexed by [alias index, weekday index]
+_REL_DAY_NAMES = np.char.add(_REL_DAY_LABELS[:, None], _WEEKDAY_ARR[None, :])
+
+def _civil_from_days(days: np.ndarray) -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
     """
-    Vectorized weekday name extraction.
+    Vectorized proleptic Gregorian calendar fields from days since epoch.
+
+    Uses Howard Hinnant's ``civil_from_days`` algorithm on int64 arrays.
+
+    Parameters
+    ----------
+    days : numpy.ndarray
+        Array of int64 days since 1970-01-01.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Year, month (1-12) and day of month (1-31) arrays.
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = np.where(mp < 10, mp + 3, mp - 9)
+    y = yoe + era * 400 + (m <= 2)
+    return y, m, d
+
+def _format_year(y: np.ndarray) -> np.ndarray:
+    """
+    Render years as zero-padded 4-digit strings.
+    """
+    if len(y) and y.min() >= 0 and y.max() <= 9999:
+        return _str_concat(_TWO_DIGITS[y // 100], _TWO_DIGITS[y % 100])
+    return np.char.zfill(y.astype(str), 4)
+
+def _days_since_epoch(dt64: np.ndarray) -> np.ndarray:
+    """
+    Convert datetime64 values of any unit to int64 days since 1970-01-01.
 
     Parameters
     ----------
     dt64 : numpy.ndarray
         Array of datetime64 values.
 
+    Returns
+    -------
+    numpy.ndarray
+        Array of int64 day counts.
+    """
+    if dt64.dtype != np.dtype('datetime64[D]'):
+        dt64 = dt64.astype('datetime64[D]')
+    return dt64.view(np.int64)
+
+def _get_weekday_name_vec(days: np.ndarray) -> np.ndarray:
+    """
+    Vectorized weekday name extraction.
+
+    Parameters
+    ----------
+    days : numpy.ndarray
+        Array of int64 days since 1970-01-01 (see ``_days_since_epoch``).
+
     Returns
     -------
     numpy.ndarray
         Array of weekday abbreviations.
     """
-    days = dt64.astype('datetime64[D]').astype(int)
-    idx = (days + 3) % 7
-    labels = np.array(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
-    return labels[idx]
+    # 1970-01-01 was a Thursday
+    return _WEEKDAY_ARR[(days + 3) % 7]
 
 @_unique_optimization
-def nday(date: Union[np.ndarray, list, datetime.date], show_relative_day: bool = False) -> Union[np.ndarray, str]:
+def nday(date: Union[np.ndarray, list, datetime.date], show_relative_day: bool = False,
+         today: Optional[Union[np.datetime64, datetime.date, str]] = None) -> Union[np.ndarray, str]:
     """
     Format dates as day names, optionally with relative alias (Today, Yesterday, etc).
 
@@ -33,6 +98,9 @@ def nday(date: Union[np.ndarray, list, datetime.date], show_relative_day: bool =
         Input date(s).
     show_relative_day : bool, default False
         If True, adds context like 'Today', 'Yesterday', 'Coming', 'Last'.
+    today : date-like, optional
+        Reference date for the relative aliases. Defaults to the current
+        local date.
 
     Returns
     -------
@@ -63,26 +131,19 @@ def nday(date: Union[np.ndarray, list, datetime.date], show_relative_day: bool =
         return result
         
     valid_dates = date[mask]
-    
-    day_str = _get_weekday_name_vec(valid_dates)
+    days = _days_since_epoch(valid_dates)
     
     if show_relative_day:
-        today = np.datetime64('today')
-        d_day = valid_dates.astype('datetime64[D]')
-        today_day = today.astype('datetime64[D]')
-        
-        diff = (today_day - d_day) / np.timedelta64(1, 'D')
-        diff = diff.astype(int)
-        
-        alias = np.full(len(diff), "", dtype='<U20')
+        if today is None:
+            today = 'today'
+        today_day = np.datetime64(today, 'D').astype(np.int64)
+        diff = today_day - days
         
-        alias[(diff >= 2) & (diff <= 8)] = "Last "
-        alias[diff == 1] = "Yesterday, "
-        alias[diff == 0] = "Today, "
-        alias[diff == -1] = "Tomorrow, "
-        alias[(diff >= -8) & (diff <= -2)] = "Coming "
-        
-        day_str = np.char.add(alias, day_str)
+        # One gather from the precomputed alias x weekday table
+        idx = np.clip(diff + _REL_DAY_OFFSET, 0, len(_REL_DAY_LABELS) - 1)
+        day_str = _REL_DAY_NAMES[idx, (days + 3) % 7]
+    else:
+        day_str = _get_weekday_name_vec(days)
         
     result[mask] = day_str
     return result
@@ -133,41 +194,31 @@ def ndate(date: Union[np.ndarray, list, datetime.date], show_weekday: bool = Tru
         return result
         
     valid_dates = date[mask]
+    days = _days_since_epoch(valid_dates)
     
-    iso = np.datetime_as_string(valid_dates, unit='D')
+    yr, mm, dd_int = _civil_from_days(days)
     
     if show_month_year:
-        months_full = ["", "Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        months_arr = np.array(months_full)
+        # Last two digits of the year number, as for positive years
+        yy = _TWO_DIGITS[np.abs(yr) % 100]
         
-        mm = np.array([s[5:7] for s in iso], dtype=int)
-        yy = np.array([s[2:4] for s in iso])
+        mon_str = _MONTHS_ARR[mm]
         
-        mon_str = months_arr[mm]
-        
-        s = np.char.add(np.char.add(mon_str, "'"), yy)
+        s = _str_concat(mon_str, "'", yy)
         
     else:
-        months_full = ["", "Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        months_arr = np.array(months_full)
-        
-        yyyy = np.array([s[0:4] for s in iso])
-        mm = np.array([s[5:7] for s in iso], dtype=int)
-        dd = np.array([s[8:10] for s in iso])
+        yyyy = _format_year(yr)
+        dd = _TWO_DIGITS[dd_int]
         
-        mon_str = months_arr[mm]
+        mon_str = _MONTHS_ARR[mm]
         
-        p1 = np.char.add(mon_str, " ")
-        p2 = np.char.add(p1, dd)
-        p3 = np.char.add(p2, ", ")
-        s = np.char.add(p3, yyyy)
+        pieces = [mon_str, " ", dd, ", ", yyyy]
         
         if show_weekday:
-            wd = _get_weekday_name_vec(valid_dates)
-            w_part = np.char.add(" (", np.char.add(wd, ")"))
-            s = np.char.add(s, w_part)
+            wd = _get_weekday_name_vec(days)
+            pieces += [" (", wd, ")"]
+            
+        s = _str_concat(*pieces)
             
     result[mask] = s
     return result
@@ -223,67 +274,52 @@ def ntimestamp(timestamp: Union[np.ndarray, list, datetime.datetime],
     if not np.any(mask):
         return result
         
+    # NaT is already excluded by `mask`, so the raw int64 views below never
+    # see the NaT sentinel
     valid_ts = timestamp[mask]
+    if valid_ts.dtype != np.dtype('datetime64[s]'):
+        valid_ts = valid_ts.astype('datetime64[s]')
+    secs = valid_ts.view(np.int64)
     
-    iso = np.datetime_as_string(valid_ts, unit='s')
+    # Floor division keeps pre-1970 timestamps on the correct day
+    days = secs // 86400
     
     parts_list = []
     
     if show_date:
-        months_full = ["", "Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        months_arr = np.array(months_full)
-        
-        yyyy = np.array([s[0:4] for s in iso])
-        mm = np.array([s[5:7] for s in iso], dtype=int)
-        dd = np.array([s[8:10] for s in iso])
-        mon_str = months_arr[mm]
-        
-        d_str = np.char.add(mon_str, " ")
-        d_str = np.char.add(d_str, dd)
-        d_str = np.char.add(d_str, ", ")
-        d_str = np.char.add(d_str, yyyy)
-        d_str = np.char.add(d_str, " ")
+        yr, mm, dd_int = _civil_from_days(days)
+        yyyy = _format_year(yr)
+        dd = _TWO_DIGITS[dd_int]
+        mon_str = _MONTHS_ARR[mm]
         
-        parts_list.append(d_str)
+        parts_list += [mon_str, " ", dd, ", ", yyyy, " "]
 
-    hh_str = np.array([s[11:13] for s in iso])
-    mm_str = np.array([s[14:16] for s in iso])
-    ss_str = np.array([s[17:19] for s in iso])
-    
-    hh_int = hh_str.astype(int)
-    is_pm = hh_int >= 12
-    
-    hh_12 = hh_int.copy()
-    hh_12[hh_12 == 0] = 12
-    hh_12[hh_12 > 12] -= 12
-    
-    hours_labels = np.array([f"{i:02d}" for i in range(13)])
-    hh_12_str = hours_labels[hh_12]
+    # Only the fields that are displayed are computed; the hour is always
+    # needed for the AM/PM suffix
+    sec_of_day = secs - days * 86400
+    hh_int = sec_of_day // 3600
     
     if show_hours:
-        parts_list.append(np.char.add(hh_12_str, "H"))
+        # Maps 0 -> 12, 1..12 -> 1..12, 13..23 -> 1..11
+        hh_12 = (hh_int + 11) % 12 + 1
+        parts_list += [_TWO_DIGITS[hh_12], "H"]
         
     if show_minutes:
-        parts_list.append(np.char.add(" ", np.char.add(mm_str, "M")))
+        parts_list += [" ", _TWO_DIGITS[sec_of_day // 60 % 60], "M"]
         
     if show_seconds:
-        parts_list.append(np.char.add(" ", np.char.add(ss_str, "S")))
+        parts_list += [" ", _TWO_DIGITS[sec_of_day % 60], "S"]
         
     if show_timezone:
         pass
         
-    ampm_arr = np.where(is_pm, " PM", " AM")
-    parts_list.append(ampm_arr)
+    parts_list.append(_AMPM_ARR[hh_int // 12])
     
-    combined = parts_list[0]
-    for p in parts_list[1:]:
-        combined = np.char.add(combined, p)
-        
     if show_weekday:
-        wd = _get_weekday_name_vec(valid_ts)
-        w_part = np.char.add(" (", np.char.add(wd, ")"))
-        combined = np.char.add(combined, w_part)
+        wd = _get_weekday_name_vec(days)
+        parts_list += [" (", wd, ")"]
+        
+    combined = _str_concat(*parts_list)
         
     result[mask] = combined
     return result
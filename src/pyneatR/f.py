@@ -1,43 +1,59 @@
 import numpy as np
 import datetime
 from .dates import ndate, ntimestamp, nday
-from .numbers import nnumber, npercent
+from .numbers import nnumber, npercent, _format_fixed
 from .strings import nstring
 from .currency import ncurrency
 from .locale import resolve_locale
+from .utils import _str_concat
 from typing import Union, Any, Optional
 
+# Exact Python scalar types resolved with one dict lookup
+_SCALAR_TYPE_FORMATS = {
+    datetime.datetime: 'ts',
+    datetime.date: 'date',
+    int: 'number',
+    float: 'number',
+    str: 'string',
+}
+
+# numpy dtype kinds that format as numbers (timedelta64 is an integer subtype)
+_NUMBER_KINDS = frozenset('iufcm')
+
+_DAY_DTYPE = np.dtype('datetime64[D]')
+
 def _infer_type(x: Any) -> str:
     """
     Infer the format type from the input.
     """
-    if isinstance(x, (datetime.datetime, np.datetime64)):
-        # Check if it's a date or timestamp
-        if isinstance(x, datetime.datetime):
-            return 'ts'
-        # For numpy datetime64, check unit
-        if "datetime64[D]" in str(getattr(x, 'dtype', '')):
-            return 'date'
+    format_type = _SCALAR_TYPE_FORMATS.get(type(x))
+    if format_type is not None:
+        return format_type
+        
+    # Subclasses such as pandas.Timestamp
+    if isinstance(x, datetime.datetime):
         return 'ts'
-    
-    if isinstance(x, (datetime.date)):
+    if isinstance(x, datetime.date):
         return 'date'
         
-    x_arr = np.asanyarray(x)
+    # Arrays, numpy scalars and pandas objects carry a numpy dtype already
+    dtype = getattr(x, 'dtype', None)
+    if not isinstance(dtype, np.dtype):
+        x = np.asanyarray(x)
+        dtype = x.dtype
+    kind = dtype.kind
     
-    if np.issubdtype(x_arr.dtype, np.datetime64):
-         # If unit is D, it's date, else ts
-         if "[D]" in str(x_arr.dtype):
-             return 'date'
-         return 'ts'
-         
-    if np.issubdtype(x_arr.dtype, np.number):
+    if kind == 'M':
+        # If unit is D, it's date, else ts
+        return 'date' if dtype == _DAY_DTYPE else 'ts'
+        
+    if kind in _NUMBER_KINDS:
         return 'number'
         
-    if np.issubdtype(x_arr.dtype, np.object_):
+    if kind == 'O':
         # Check if it's mixed numeric
         try:
-            temp = x_arr.astype(float)
+            temp = np.asanyarray(x).astype(float)
             if not np.all(np.isnan(temp)):
                 return 'number'
         except (ValueError, TypeError):
@@ -97,14 +113,12 @@ def f(x: Any, format_type: Optional[str] = None, locale: "Optional[str]" = None,
         # Add timezone label before the weekday part if available
         if tz_label and params.get('show_timezone', True):
             if isinstance(res, np.ndarray):
-                def inject_tz(s):
-                    idx = s.rfind(" (")
-                    if idx != -1:
-                        return s[:idx] + " " + tz_label + s[idx:]
-                    return s + " " + tz_label
-                    
-                inject_vec = np.vectorize(inject_tz, otypes=[object])
-                res = inject_vec(res)
+                parts = np.char.rpartition(res.astype(str), " (")
+                head, sep, tail = parts[..., 0], parts[..., 1], parts[..., 2]
+                # rpartition puts the whole string in `tail` when " (" is absent
+                res = np.where(sep != "",
+                               _str_concat(head, " " + tz_label, sep, tail),
+                               _str_concat(tail, " " + tz_label)).astype(object)
             else:
                 idx = res.rfind(" (")
                 if idx != -1:
@@ -145,22 +159,22 @@ def f(x: Any, format_type: Optional[str] = None, locale: "Optional[str]" = None,
         # 2. Growth factor string (e.g. 9x growth) - remove space
         mult = x_val if is_ratio else x_val / 100.0
         growth_val = np.abs(mult)
-        # Format growth: no space between number and x
-        growth_str_list = [f"{v:.1f}" if v % 1 != 0 else f"{int(v)}" for v in np.atleast_1d(growth_val)]
+        # Format growth: no space between number and x; whole multiples drop the decimal
+        growth_val = np.atleast_1d(growth_val)
+        is_whole = np.isfinite(growth_val) & (np.modf(growth_val)[0] == 0)
+        growth_str = np.where(is_whole, _format_fixed(growth_val, 0), _format_fixed(growth_val, 1))
         growth_labels = np.where(mult >= 0, "x growth", "x drop")
         growth_labels_1d = np.atleast_1d(growth_labels)
-        growth_full = np.array([f"{s}{lbl}" for s, lbl in zip(growth_str_list, growth_labels_1d)])
+        growth_full = np.char.add(growth_str, growth_labels_1d)
         
         # 3. Basis points string (e.g. 90K basis points) - remove space in nnumber output
         bps_val = x_val * 10000 if is_ratio else x_val * 100
         bps_fmt_arr = nnumber(bps_val, digits=0, thousand_separator=',')
         # Remove space before K, Mn, Bn, etc. in bps
         bps_fmt_clean = np.char.replace(bps_fmt_arr, " ", "")
-        bps_full = np.char.add(bps_fmt_clean, " basis points")
         
         # Combine: +900% (9x growth, 90K basis points)
-        rhs = np.char.add(" (", np.char.add(growth_full, np.char.add(", ", np.char.add(bps_full, ")"))))
-        comp = np.char.add(main_pct, rhs)
+        comp = _str_concat(main_pct, " (", growth_full, ", ", bps_fmt_clean, " basis points)")
         
         if np.isscalar(x) and not isinstance(x, (np.ndarray, list)):
              return comp[0]
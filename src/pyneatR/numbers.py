@@ -1,13 +1,276 @@
 import numpy as np
-from .utils import _check_singleton, _sandwich, _unique_optimization
+import functools
+from .utils import _check_singleton, _sandwich, _factorize, _str_concat
 from .locale import resolve_locale, format_grouped_number
 from typing import Union, Dict, Optional
 
 
+# Largest |value| * 10**digits that round-trips exactly through float64 -> int64.
+_MAX_EXACT_INT = 2 ** 53
+_MAX_VECTOR_DIGITS = 15
+
+_DEFAULT_UNIT_LABELS = {'thousand': 'K', 'million': 'Mn', 'billion': 'Bn', 'trillion': 'Tn'}
+_DEFAULT_LABELS = ['', 'K', 'Mn', 'Bn', 'Tn']
+_DEFAULT_LABELS_ARR = np.array(_DEFAULT_LABELS)
+_FACTORS_ARR = np.array([1.0, 1e-3, 1e-6, 1e-9, 1e-12])
+
+# Integer -> digit string tables: unpadded 0-999, and zero-padded to 1-3 digits
+_GROUP_HEAD = np.array([str(i) for i in range(1000)])
+_PADDED_DIGITS = {w: np.array([f"{i:0{w}d}" for i in range(10 ** w)]) for w in (1, 2, 3)}
+_SIGN_ARR = np.array(["", "-", "+"])
+# str.format output for inf, -inf and nan, indexed by _nonfinite_class
+_NONFINITE_ARR = np.array(["inf", "-inf", "nan"])
+_NONFINITE_PLUS_ARR = np.array(["+inf", "-inf", "nan"])
+
+
+@functools.lru_cache(maxsize=8)
+def _group_table(thousand_separator: str) -> np.ndarray:
+    """
+    Lookup table of rendered 3-digit groups followed by a separator.
+
+    Index ``g`` gives the unpadded leading group ``str(g)``, ``1000 + g``
+    the zero-padded inner group ``f"{g:03d}"`` and ``2000`` the empty string
+    for groups beyond the leading one.
+    """
+    return np.concatenate([np.char.add(_GROUP_HEAD, thousand_separator),
+                           np.char.add(_PADDED_DIGITS[3], thousand_separator), [""]])
+
+
+def _group_thousands(whole: np.ndarray, thousand_separator: str) -> "list[np.ndarray]":
+    """
+    Render non-negative integers with a separator between 3-digit groups.
+
+    Each group is gathered from a 1000-entry string table, so digits are
+    never produced one integer at a time.
+
+    Parameters
+    ----------
+    whole : numpy.ndarray
+        Array of non-negative int64 values.
+    thousand_separator : str
+        Separator inserted between groups (empty string for none).
+
+    Returns
+    -------
+    list of numpy.ndarray
+        Pieces, most significant group first, whose element-wise
+        concatenation (see ``_str_concat``) is the grouped integer string.
+    """
+    n_groups = 1
+    top = int(whole.max()) if len(whole) else 0
+    while top >= 1000:
+        top //= 1000
+        n_groups += 1
+        
+    # Position of each value's leading (unpadded) group
+    lead = np.zeros(len(whole), dtype=np.intp)
+    for k in range(1, n_groups):
+        lead += whole >= 1000 ** k
+        
+    pieces = []
+    for k in range(n_groups - 1, -1, -1):
+        idx = (whole // 1000 ** k) % 1000 + 1000 * (k < lead)
+        if k > 0:
+            idx[k > lead] = 2000
+            pieces.append(_group_table(thousand_separator)[idx])
+        else:
+            pieces.append(_group_table("")[idx])
+            
+    return pieces
+
+
+def _frac_pieces(frac: np.ndarray, digits: int) -> "list[np.ndarray]":
+    """
+    Render integers below ``10**digits`` as zero-padded ``digits``-wide pieces.
+    """
+    pieces = []
+    for k in range((digits - 1) // 3, -1, -1):
+        width = min(digits - 3 * k, 3)
+        pieces.append(_PADDED_DIGITS[width][(frac // 1000 ** k) % 10 ** width])
+    return pieces
+
+
+def _format_fixed_py(vals: np.ndarray, digits: int, thousand_separator: str = '') -> np.ndarray:
+    """
+    Per-element ``str.format`` fallback for :func:`_format_fixed`.
+    """
+    spec = "," if thousand_separator else ""
+    fmt_str = f"{{:{spec}.{digits}f}}"
+    formatted = np.array([fmt_str.format(v) for v in vals], dtype=object)
+    if thousand_separator and thousand_separator != ',':
+        formatted = np.array([v.replace(',', thousand_separator) for v in formatted], dtype=object)
+    return formatted.astype(str)
+
+
+def _scaled_ints(vals: np.ndarray, digits: int) -> "tuple[np.ndarray, np.ndarray]":
+    """
+    Round ``abs(vals) * 10**digits`` to the nearest integer, half to even.
+
+    Parameters
+    ----------
+    vals : numpy.ndarray
+        Array of floats.
+    digits : int
+        Number of decimal digits, between 0 and ``_MAX_VECTOR_DIGITS``.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The rounded int64 magnitudes, and a mask of finite values whose
+        rounding cannot be decided exactly in float64 (their magnitude is
+        set to 0). Non-finite values also get a magnitude of 0.
+    """
+    finite = np.isfinite(vals)
+    with np.errstate(invalid='ignore', over='ignore'):
+        product = np.abs(np.where(finite, vals, 0.0)) * 10 ** digits
+    scaled = np.rint(product)
+    
+    # The product carries up to half an ulp of error, so anything that close
+    # to a .5 tie may round differently from the exact decimal expansion.
+    tie_dist = np.abs(np.abs(product - scaled) - 0.5)
+    fallback = (tie_dist <= product * 2.0 ** -52) | (scaled >= _MAX_EXACT_INT)
+    
+    ints = np.where(fallback, 0, scaled).astype(np.int64)
+    return ints, fallback & finite
+
+
+def _nonfinite_class(vals: np.ndarray) -> np.ndarray:
+    """
+    Classify non-finite floats as 0 (inf), 1 (-inf) or 2 (nan).
+    """
+    return np.where(np.isnan(vals), 2, np.signbit(vals).astype(np.intp))
+
+
+def _factorize_display(vals: np.ndarray, digits: int, tags: Optional[np.ndarray] = None,
+                       n_tags: int = 1) -> "tuple[Optional[np.ndarray], Optional[np.ndarray]]":
+    """
+    Deduplicate floats on their rounded display value rather than their bits.
+
+    Values that render identically at ``digits`` decimals (same rounded
+    magnitude, same sign class and same tag) share one code, so callers only
+    format one representative per code. nan, inf and -inf each share one
+    code per tag; values whose rounding falls back to Python formatting are
+    never merged.
+
+    Parameters
+    ----------
+    vals : numpy.ndarray
+        One-dimensional array of floats.
+    digits : int
+        Number of decimal digits to display.
+    tags : numpy.ndarray, optional
+        Small non-negative ints (e.g. unit indices) that also affect the output.
+    n_tags : int, default 1
+        Upper bound (exclusive) of ``tags``.
+
+    Returns
+    -------
+    tuple
+        ``(rep, inverse)`` such that ``vals[rep][inverse]`` renders like
+        ``vals``, or ``(None, None)`` if deduplication was skipped.
+    """
+    if len(vals) == 0 or not 0 <= digits <= _MAX_VECTOR_DIGITS:
+        return None, None
+        
+    ints, fallback = _scaled_ints(vals, digits)
+    # Negative, -0.0, 0.0 and positive values may all render differently
+    sign_cls = np.signbit(vals) + 2 * (vals != 0)
+    key = (ints * 4 + sign_cls) * n_tags
+    if tags is not None:
+        key += tags
+        
+    # Negative keys: 3 * n_tags slots for nan/inf/-inf, then one per fallback
+    nonfinite = ~np.isfinite(vals)
+    if np.any(nonfinite):
+        nf_key = _nonfinite_class(vals[nonfinite]) * n_tags
+        if tags is not None:
+            nf_key = nf_key + tags[nonfinite]
+        key[nonfinite] = -1 - nf_key
+    if np.any(fallback):
+        key[fallback] = -1 - 3 * n_tags - np.flatnonzero(fallback)
+        
+    ukeys, inverse = _factorize(key)
+    if inverse is None:
+        return None, None
+        
+    rep = np.empty(len(ukeys), dtype=np.intp)
+    rep[inverse] = np.arange(len(vals))
+    return rep, inverse
+
+
+def _format_fixed(vals: np.ndarray, digits: int, thousand_separator: str = '',
+                  plus_sign: bool = False, suffix: str = '') -> np.ndarray:
+    """
+    Vectorized equivalent of ``f"{v:,.{digits}f}"`` for an array of floats.
+
+    Values are rounded to integers scaled by ``10**digits`` and split into
+    whole and fractional parts with integer arithmetic, so no per-element
+    Python formatting is involved. Values whose rounding is ambiguous in
+    float64 (near-ties) or too large for exact int64 arithmetic fall back
+    to Python's formatter, so the output is identical to ``str.format``.
+
+    Parameters
+    ----------
+    vals : numpy.ndarray
+        Array of floats.
+    digits : int
+        Number of decimal digits to display.
+    thousand_separator : str, default ''
+        Separator between 3-digit groups of the integer part.
+    plus_sign : bool, default False
+        If True, prepend '+' to positive values.
+    suffix : str, default ''
+        String appended to every value, in the same concatenation pass.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of formatted number strings.
+    """
+    vals = np.asarray(vals, dtype=float)
+    if len(vals) == 0 or not 0 <= digits <= _MAX_VECTOR_DIGITS:
+        special = np.ones(len(vals), dtype=bool)
+        out = np.zeros(len(vals), dtype='<U1')
+    else:
+        scale = 10 ** digits
+        ints, fallback = _scaled_ints(vals, digits)
+        whole, frac = np.divmod(ints, scale)
+        
+        sign_idx = np.signbit(vals).view(np.uint8)
+        if plus_sign:
+            sign_idx = sign_idx + 2 * (vals > 0)
+        pieces = [_SIGN_ARR[sign_idx]]
+        pieces += _group_thousands(whole, thousand_separator)
+        if digits > 0:
+            pieces.append(".")
+            pieces += _frac_pieces(frac, digits)
+        if suffix:
+            pieces.append(suffix)
+        out = _str_concat(*pieces)
+        special = fallback
+        
+        nonfinite = ~np.isfinite(vals)
+        if np.any(nonfinite):
+            labels = (_NONFINITE_PLUS_ARR if plus_sign else _NONFINITE_ARR)
+            labels = labels[_nonfinite_class(vals[nonfinite])]
+            if suffix:
+                labels = _str_concat(labels, suffix)
+            out = out.astype(np.result_type(out.dtype, labels.dtype))
+            out[nonfinite] = labels
+        
+    if np.any(special):
+        special_vals = vals[special]
+        slow = _format_fixed_py(special_vals, digits, thousand_separator)
+        if plus_sign:
+            slow = np.char.add(np.where(special_vals > 0, "+", ""), slow)
+        if suffix:
+            slow = np.char.add(slow, suffix)
+        out = out.astype(np.result_type(out.dtype, slow.dtype))
+        out[special] = slow
+
+    return out
+
 
-# Bug #4 fix: removed @_unique_optimization decorator since nnumber
-# manages its own internal np.unique optimization.  The decorator was
-# causing a redundant second unique pass.
 def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit: str = 'custom', 
             unit_labels: Optional[Dict[str, str]] = None,
             prefix: str = '', suffix: str = '', thousand_separator: str = ',',
@@ -61,7 +324,7 @@ def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit:
         if locale_obj is not None:
             unit_labels = locale_obj.unit_labels
         else:
-            unit_labels = {'thousand': 'K', 'million': 'Mn', 'billion': 'Bn', 'trillion': 'Tn'}
+            unit_labels = _DEFAULT_UNIT_LABELS
     
     # Override separators from locale
     if locale_obj is not None:
@@ -82,13 +345,20 @@ def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit:
         for threshold, factor, label_key in reversed(locale_obj.unit_thresholds):
             labels.append(unit_labels.get(label_key, label_key))
             factors.append(factor)
+        labels_arr = np.array(labels)
+        factors_arr = np.array(factors, dtype=float)
+    elif unit_labels is _DEFAULT_UNIT_LABELS:
+        labels = _DEFAULT_LABELS
+        labels_arr = _DEFAULT_LABELS_ARR
+        factors_arr = _FACTORS_ARR
     else:
         labels = ['', 
                   unit_labels.get('thousand', 'K'),
                   unit_labels.get('million', 'Mn'),
                   unit_labels.get('billion', 'Bn'),
                   unit_labels.get('trillion', 'Tn')]
-        factors = [1, 1e-3, 1e-6, 1e-9, 1e-12]
+        labels_arr = np.array(labels)
+        factors_arr = _FACTORS_ARR
     
     final_unit_idx = 0
     fixed_unit = False
@@ -128,37 +398,45 @@ def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit:
     else:
          raise ValueError(f"Invalid unit: '{unit}'")
 
-    uvals, inverse = np.unique(x_flat, return_inverse=True)
-    
-    if fixed_unit:
-        indices = np.full(len(uvals), final_unit_idx, dtype=int)
+    if not fixed_unit and locale_obj is not None and locale_obj.unit_thresholds:
+        # Threshold matching is a per-value loop, so run it on distinct inputs
+        uvals, inverse = _factorize(x_flat)
+        
+        # Use threshold-based matching for locale-aware unit selection
+        indices = np.zeros(len(uvals), dtype=int)
+        for i, v in enumerate(uvals):
+            if v == 0 or not np.isfinite(v):
+                continue
+            abs_v = abs(v)
+            for t_idx, (threshold, factor, label_key) in enumerate(locale_obj.unit_thresholds):
+                if abs_v >= threshold:
+                    # Find the index in our labels array
+                    lbl = unit_labels.get(label_key, label_key)
+                    if lbl in labels:
+                        indices[i] = labels.index(lbl)
+                    break
     else:
-        if locale_obj is not None and locale_obj.unit_thresholds:
-            # Use threshold-based matching for locale-aware unit selection
-            indices = np.zeros(len(uvals), dtype=int)
-            for i, v in enumerate(uvals):
-                if v == 0 or not np.isfinite(v):
-                    continue
-                abs_v = abs(v)
-                for t_idx, (threshold, factor, label_key) in enumerate(locale_obj.unit_thresholds):
-                    if abs_v >= threshold:
-                        # Find the index in our labels array
-                        lbl = unit_labels.get(label_key, label_key)
-                        if lbl in labels:
-                            indices[i] = labels.index(lbl)
-                        break
+        if fixed_unit:
+            indices = np.full(len(x_flat), final_unit_idx, dtype=int)
         else:
             with np.errstate(divide='ignore', invalid='ignore'):
-                 nonzero = (uvals != 0) & np.isfinite(uvals)
-                 indices = np.zeros(len(uvals), dtype=int)
+                 nonzero = (x_flat != 0) & np.isfinite(x_flat)
+                 indices = np.zeros(len(x_flat), dtype=int)
                  if np.any(nonzero):
-                     logs = np.log10(np.abs(uvals[nonzero]))
+                     logs = np.log10(np.abs(x_flat[nonzero]))
                      vals = np.floor(logs / 3).astype(int)
                      limit = len(labels) - 1
                      indices[nonzero] = np.clip(vals, 0, limit)
-    
-    factors_arr = np.array(factors)
-    labels_arr = np.array(labels)
+        
+        # Many inputs share a displayed value (e.g. 1234 and 1249 at 1 digit
+        # both read "1.2 K"), so deduplicate on the rounded value and unit
+        rep, inverse = _factorize_display(x_flat * factors_arr[indices], digits,
+                                          indices, len(labels_arr))
+        if rep is None:
+            uvals = x_flat
+        else:
+            uvals = x_flat[rep]
+            indices = indices[rep]
     
     scales = factors_arr[indices]
     unit_lbls = labels_arr[indices]
@@ -196,9 +474,7 @@ def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit:
         
         formatted_arr = np.array(formatted_list)
     else:
-        fmt_str = f"{{:,.{digits}f}}"
-        formatted_list = [fmt_str.format(v) for v in scaled_vals]
-        formatted_arr = np.array(formatted_list)
+        formatted_arr = _format_fixed(scaled_vals, digits, ',')
         
         # Handle separator replacements
         if use_locale_grouping and decimal_separator != '.':
@@ -228,7 +504,9 @@ def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit:
     if prefix or suffix:
         formatted_uvals = _sandwich(formatted_uvals, prefix, suffix)
     
-    result = formatted_uvals[inverse].reshape(original_shape)
+    if inverse is not None:
+        formatted_uvals = formatted_uvals[inverse]
+    result = formatted_uvals.reshape(original_shape)
     
     if is_scalar or result.ndim == 0:
         return result.item()
@@ -236,7 +514,6 @@ def nnumber(number: Union[np.ndarray, list, float, int], digits: int = 1, unit:
     return result
 
 
-@_unique_optimization
 def npercent(percent: Union[np.ndarray, list, float, int], is_ratio: bool = True, digits: int = 1, 
              show_plus_sign: bool = True, show_growth_factor: bool = False, show_bps: bool = False) -> Union[np.ndarray, str]:
     """
@@ -266,54 +543,59 @@ def npercent(percent: Union[np.ndarray, list, float, int], is_ratio: bool = True
     _check_singleton(is_ratio, 'is_ratio', bool)
     _check_singleton(show_plus_sign, 'show_plus_sign', bool)
     
-    x = np.asanyarray(percent, dtype=float)
+    x_arr = np.asanyarray(percent, dtype=float)
+    original_shape = x_arr.shape
+    x_flat = x_arr.ravel()
     if is_ratio:
-        x = x * 100
+        x_flat = x_flat * 100
         
-    if len(x) == 0:
+    if len(x_flat) == 0:
         return np.array([], dtype=object)
     
+    if show_growth_factor or show_bps:
+        # The labels round differently from the main figure, so only
+        # identical inputs are guaranteed to share a result
+        x, inverse = _factorize(x_flat)
+    else:
+        rep, inverse = _factorize_display(x_flat, digits)
+        x = x_flat if rep is None else x_flat[rep]
+    
     # Bug #1 fix: removed duplicated formatting lines
-    fmt_str = f"{{:.{digits}f}}"
-    s_list = [fmt_str.format(v) for v in x]
-    s_arr = np.array(s_list)
+    s_arr = _format_fixed(x, digits, plus_sign=show_plus_sign, suffix="%")
     
-    if show_plus_sign:
-        s_arr = np.where(x > 0, np.char.add("+", s_arr), s_arr)
+    if show_growth_factor:
+        gtemp = x / 100.0
+        gtemp_abs = np.abs(gtemp)
         
-    s_arr = np.char.add(s_arr, "%")
-    
-    if show_growth_factor or show_bps:
-        extras_arr = np.array([""] * len(x))
+        g_fmt_arr = _format_fixed(gtemp_abs, 1)
         
-        if show_growth_factor:
-            gtemp = x / 100.0
-            gtemp_abs = np.abs(gtemp)
-            
-            g_fmt = [f"{v:.1f}" for v in gtemp_abs]
-            g_fmt_arr = np.array(g_fmt)
-            
-            growth_lbl = np.char.add(" (", np.char.add(g_fmt_arr, "x Growth)"))
-            drop_lbl = np.char.add(" (", np.char.add(g_fmt_arr, "x Drop)"))
-            
-            small_lbl = np.where(gtemp > 0, " (Growth)", " (Drop)")
-            small_lbl = np.where(gtemp == 0, " (Flat)", small_lbl)
-            
-            f_lbl = np.where(gtemp <= -1, drop_lbl, small_lbl)
-            f_lbl = np.where(gtemp >= 1, growth_lbl, f_lbl)
-            
-            extras_arr = np.char.add(extras_arr, f_lbl)
-            
-        if show_bps:
-            bps = x * 100.0
-            
-            bps_list = [f"{b:+.0f}" if b != 0 else "0" for b in bps]
-            bps_arr = np.array(bps_list)
-            bps_lbl = np.char.add(" (", np.char.add(bps_arr, " bps)"))
-            
-            # Bug #2 fix: removed duplicated bps append
-            extras_arr = np.char.add(extras_arr, bps_lbl)
-            
-        s_arr = np.char.add(s_arr, extras_arr)
+        growth_lbl = np.char.add(" (", np.char.add(g_fmt_arr, "x Growth)"))
+        drop_lbl = np.char.add(" (", np.char.add(g_fmt_arr, "x Drop)"))
+        
+        small_lbl = np.where(gtemp > 0, " (Growth)", " (Drop)")
+        small_lbl = np.where(gtemp == 0, " (Flat)", small_lbl)
+        
+        f_lbl = np.where(gtemp <= -1, drop_lbl, small_lbl)
+        f_lbl = np.where(gtemp >= 1, growth_lbl, f_lbl)
+        
+        s_arr = np.char.add(s_arr, f_lbl)
         
-    return s_arr
+    if show_bps:
+        bps = x * 100.0
+        
+        # Explicit sign except for exact zero, matching f"{b:+.0f}"
+        bps_arr = np.char.add(np.where(np.signbit(bps), "", "+"), _format_fixed(bps, 0))
+        bps_arr = np.where(bps == 0, "0", bps_arr)
+        bps_lbl = np.char.add(" (", np.char.add(bps_arr, " bps)"))
+        
+        # Bug #2 fix: removed duplicated bps append
+        s_arr = np.char.add(s_arr, bps_lbl)
+    
+    if inverse is not None:
+        s_arr = s_arr[inverse]
+    result = s_arr.reshape(original_shape)
+    
+    if result.ndim == 0:
+        return result.item()
+        
+    return result
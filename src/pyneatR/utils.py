@@ -1,6 +1,8 @@
 import numpy as np
 import functools
-from typing import Any, Optional, Type, Callable
+from typing import Any, Optional, Type, Callable, Tuple, Union
+
+_DEDUP_SAMPLE_SIZE = 1024
 
 def _to_numpy(x: Any) -> np.ndarray:
     """
@@ -16,6 +18,10 @@ def _to_numpy(x: Any) -> np.ndarray:
     numpy.ndarray
         Numpy array representation of input.
     """
+    if type(x).__module__.startswith("polars.") and hasattr(x, "to_numpy"):
+        # Polars' own exporter hands Date/Datetime columns over as
+        # datetime64 (nulls as NaT) without an object-dtype round trip
+        return x.to_numpy()
     return np.asanyarray(x)
 
 def _check_singleton(x: Any, var_name: str, type_check: Optional[Type] = None) -> None:
@@ -78,6 +84,172 @@ def _sandwich(x: np.ndarray, prefix: str = "", suffix: str = "") -> np.ndarray:
         
     return x
 
+def _str_concat(*pieces: Union[str, np.ndarray]) -> np.ndarray:
+    """
+    Element-wise concatenation of string arrays and literals in one pass.
+
+    Each piece is viewed as an (n, width) block of code points and all blocks
+    are laid side by side in a single buffer, instead of reallocating the
+    accumulator once per ``np.char.add``. When a piece has elements shorter
+    than its dtype width, the padding is compacted to the end of each row.
+
+    Parameters
+    ----------
+    *pieces : str or numpy.ndarray
+        Literal strings (broadcast to every element) or string arrays. All
+        arrays must have the same shape.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of concatenated strings with the shape of the array pieces.
+    """
+    shape = next(np.shape(p) for p in pieces if not isinstance(p, str))
+    n = int(np.prod(shape))
+    
+    blocks = []
+    # Per-piece masks of real characters (None where the piece fills its
+    # width); lengths come from str_len so interior NULs are kept
+    masks = []
+    for p in pieces:
+        if isinstance(p, str):
+            if p:
+                lit = np.array([p]).view(np.uint32)
+                blocks.append(np.broadcast_to(lit, (n, len(p))))
+                masks.append(None)
+            continue
+        p = np.asarray(p)
+        if p.dtype.kind != 'U':
+            p = p.astype(str)
+        width = p.dtype.itemsize // 4
+        if width == 0:
+            continue
+        block = np.ascontiguousarray(p).view(np.uint32).reshape(n, width)
+        blocks.append(block)
+        if np.all(block[:, -1]):
+            masks.append(None)
+        else:
+            lengths = np.char.str_len(p).reshape(n, 1)
+            masks.append(np.arange(width) < lengths)
+        
+    if not blocks:
+        return np.full(shape, "", dtype='<U1')
+        
+    buf = np.concatenate(blocks, axis=1)
+    if any(m is not None for m in masks):
+        # Move the padding to the end of each row: the row-major order of the
+        # kept characters matches the row-major order of the first len(row)
+        # slots, so one boolean gather/scatter compacts every row at once.
+        keep = np.concatenate([np.ones(b.shape, dtype=bool) if m is None else m
+                               for b, m in zip(blocks, masks)], axis=1)
+        dest = np.arange(buf.shape[1]) < keep.sum(axis=1)[:, None]
+        compact = np.zeros_like(buf)
+        compact[dest] = buf[keep]
+        buf = compact
+        
+    return np.ascontiguousarray(buf).view(f'<U{buf.shape[1]}').reshape(shape)
+
+def _is_mostly_unique(x_flat: np.ndarray) -> bool:
+    """
+    Estimate from a strided sample whether x_flat has close to len(x_flat)
+    distinct values.
+
+    A sample of k values drawn from C equally likely values has about
+    k**2 / (2 * C) collisions, so fewer than k**2 / n collisions means the
+    estimated cardinality exceeds half the array length.
+    """
+    n = len(x_flat)
+    step = max(n // _DEDUP_SAMPLE_SIZE, 1)
+    sample = x_flat[::step][:_DEDUP_SAMPLE_SIZE]
+    k = len(sample)
+    if sample.dtype.kind in ('f', 'c'):
+        # NaN never equals itself; count all NaNs as one value
+        nan = np.isnan(sample)
+        distinct = len(set(sample[~nan].tolist())) + bool(nan.any())
+    else:
+        distinct = len(set(sample.tolist()))
+    collisions = k - distinct
+    return collisions < k * k / n
+
+def _has_uniform_type(x_flat: np.ndarray) -> bool:
+    """
+    Check that an object array holds a single exact type, ignoring missing
+    values (None and float NaN).
+
+    Hashing treats equal values of different types as one key (``1``,
+    ``1.0`` and ``True`` collide) even though they format differently.
+    """
+    values = x_flat.tolist()
+    types = set(map(type, values))
+    types.discard(type(None))
+    if len(types) > 1 and float in types:
+        # NaN never equals anything, so NaN-only floats cannot collide
+        if not any(type(v) is float and v == v for v in values):
+            types.discard(float)
+    return len(types) <= 1
+
+def _factorize(x_flat: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Deduplicate a flat array, returning unique values and inverse codes.
+
+    Uses hash-based ``pandas.factorize`` (no sort) when pandas is available,
+    otherwise ``np.unique``. When a sample suggests the input is nearly all
+    distinct, or an object array mixes value types, deduplication is skipped
+    and ``(x_flat, None)`` is returned.
+
+    Parameters
+    ----------
+    x_flat : numpy.ndarray
+        One-dimensional input array.
+
+    Returns
+    -------
+    tuple
+        ``(uvals, inverse)`` such that ``uvals[inverse]`` reproduces x_flat,
+        or ``(x_flat, None)`` if deduplication was skipped.
+
+    Raises
+    ------
+    TypeError
+        If the values are unhashable.
+    """
+    if len(x_flat) == 0 or _is_mostly_unique(x_flat):
+        return x_flat, None
+        
+    if x_flat.dtype.kind == 'O' and not _has_uniform_type(x_flat):
+        return x_flat, None
+        
+    try:
+        import pandas as pd
+    except ImportError:
+        return np.unique(x_flat, return_inverse=True)
+    
+    if x_flat.dtype.kind in ('m', 'M'):
+        # Factorize the int64 payload so pandas keeps the original unit
+        codes, uniques = pd.factorize(x_flat.view(np.int64), sort=False)
+        return uniques.view(x_flat.dtype), codes
+    if x_flat.dtype.kind != 'O':
+        # All NaNs share one code
+        codes, uniques = pd.factorize(x_flat, sort=False, use_na_sentinel=False)
+        return np.asarray(uniques), codes
+        
+    codes, uniques = pd.factorize(x_flat, sort=False)
+    uniques = np.asarray(uniques)
+    
+    # Missing values get code -1; give each missing type (None, NaN, ...)
+    # one code of its own so it keeps its original representation
+    missing = np.flatnonzero(codes < 0)
+    if len(missing):
+        missing_types = [type(v) for v in x_flat[missing]]
+        first = {}
+        for i, t in zip(missing.tolist(), missing_types):
+            first.setdefault(t, i)
+        slot = {t: len(uniques) + k for k, t in enumerate(first)}
+        codes[missing] = [slot[t] for t in missing_types]
+        uniques = np.concatenate([uniques, x_flat[list(first.values())]])
+        
+    return uniques, codes
+
 def _unique_optimization(func: Callable) -> Callable:
     """
     Decorator to apply the unique value optimization pattern.
@@ -102,15 +274,14 @@ def _unique_optimization(func: Callable) -> Callable:
         x_flat = x_arr.ravel()
         
         try:
-            uvals, inverse = np.unique(x_flat, return_inverse=True)
+            uvals, inverse = _factorize(x_flat)
         except (TypeError, ValueError):
-            # Fallback for mixed types or other unique failures
-            uvals = x_flat
-            inverse = np.arange(len(x_flat))
+            # Fallback for unhashable values or other unique failures
+            uvals, inverse = x_flat, None
         
         formatted_uvals = func(uvals, **kwargs)
         
-        result_flat = formatted_uvals[inverse]
+        result_flat = formatted_uvals if inverse is None else formatted_uvals[inverse]
         result = result_flat.reshape(original_shape)
         
         if result.ndim == 0:
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def pl():
+    # Skip only the tests that need polars, not whole modules, when it is missing
+    return pytest.importorskip("polars")
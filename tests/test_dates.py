@@ -3,6 +3,8 @@ import numpy as np
 import datetime
 from pyneatR import ndate, ntimestamp, nday
 
+TODAY = np.datetime64('today', 'D')
+
 def test_ndate():
     d = np.array(['2023-01-01', '2023-01-02'], dtype='datetime64[D]')
     res = ndate(d, show_weekday=False)
@@ -33,15 +35,17 @@ def test_nday_alias():
     res = nday(d, show_relative_day=False)
     assert res[0] == "Sun"
     
-    # Relative alias test - risky if 'today' changes, but relative logic:
-    # If we pass today
-    today = np.datetime64('today')
-    res_today = nday([today], show_relative_day=True)
+    # Pin the reference date so the check cannot straddle midnight
+    res_today = nday([TODAY], show_relative_day=True, today=TODAY)
     assert "Today" in res_today[0]
     
-    yesterday = today - np.timedelta64(1, 'D')
-    res_yest = nday([yesterday], show_relative_day=True)
+    yesterday = TODAY - np.timedelta64(1, 'D')
+    res_yest = nday([yesterday], show_relative_day=True, today=TODAY)
     assert "Yesterday" in res_yest[0]
+    
+    # Explicit reference date
+    res_ref = nday(d, show_relative_day=True, today=datetime.date(2023, 1, 3))
+    assert res_ref[0] == "Last Sun"
 
 def test_ndate_scalars():
     # Test datetime.date scalar
@@ -75,16 +79,14 @@ def test_nday_scalars():
     assert res == "Sun"
 
 def test_nday_future():
-    today = np.datetime64('today', 'D')
-    
     # Tomorrow
-    tmrw = today + np.timedelta64(1, 'D')
-    res_tmrw = nday(tmrw, show_relative_day=True)
+    tmrw = TODAY + np.timedelta64(1, 'D')
+    res_tmrw = nday(tmrw, show_relative_day=True, today=TODAY)
     assert "Tomorrow" in res_tmrw
     
     # Coming (2-8 days)
-    coming = today + np.timedelta64(5, 'D')
-    res_coming = nday(coming, show_relative_day=True)
+    coming = TODAY + np.timedelta64(5, 'D')
+    res_coming = nday(coming, show_relative_day=True, today=TODAY)
     assert "Coming" in res_coming
 
 def test_ntimestamp_components():
@@ -134,3 +136,8 @@ def test_date_errors():
     except Exception:
         pass # If it raises, fine. If it returns NaT, fine. Just want to ensure coverage.
 
+
+def test_ndate_month_year_negative_year():
+    d = np.array(['-068-07-17', '2023-01-05'], dtype='datetime64[D]')
+    res = ndate(d, show_month_year=True)
+    assert list(res) == ["Jul'68", "Jan'23"]
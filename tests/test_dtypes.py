@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import datetime
+from pyneatR import nnumber, npercent, nstring, ndate, nday, ntimestamp, f
+
+TODAY = datetime.date.today()
+
+ARRAY_CASES = [
+    (nnumber, np.array([1500.0, 2.5e6]), {}, "U"),
+    (npercent, np.array([0.5, 0.2]), {}, "U"),
+    (npercent, np.array([0.5, 0.2]), {"show_growth_factor": True, "show_bps": True}, "U"),
+    (f, np.array([0.5]), {"format_type": "percent"}, "U"),
+    (nstring, np.array(["Hello World!"]), {"case": "upper"}, "O"),
+    (ndate, np.array(["2024-01-01"], dtype="datetime64[D]"), {}, "O"),
+    (nday, np.array([TODAY]), {"show_relative_day": True}, "O"),
+    (ntimestamp, np.array(["2024-01-01T10:15:30"], dtype="datetime64[s]"), {}, "O"),
+]
+
+SCALAR_CASES = [
+    (nnumber, 1500.0, {}),
+    (npercent, 0.5, {}),
+    (f, 0.5, {"format_type": "percent"}),
+    (nstring, "Hello World!", {"case": "upper"}),
+    (ndate, TODAY, {}),
+    (nday, TODAY, {"show_relative_day": True}),
+    (ntimestamp, datetime.datetime(2024, 1, 1, 10, 15, 30), {}),
+]
+
+@pytest.mark.parametrize("fn,arg,kwargs,kind", ARRAY_CASES,
+                         ids=lambda p: getattr(p, "__name__", None))
+def test_array_input_returns_string_array(fn, arg, kwargs, kind):
+    out = fn(arg, **kwargs)
+    assert isinstance(out, np.ndarray)
+    assert out.dtype.kind == kind
+    assert out.shape == arg.shape
+    assert all(isinstance(v, str) for v in out)
+
+@pytest.mark.parametrize("fn,arg,kwargs", SCALAR_CASES,
+                         ids=lambda p: getattr(p, "__name__", None))
+def test_scalar_input_returns_str(fn, arg, kwargs):
+    out = fn(arg, **kwargs)
+    assert isinstance(out, str)
@@ -49,3 +49,46 @@ def test_mixed_types_strings():
     assert res[0] == "hello"
     # 123 might be converted to "123"
     # None handling depends on implementation
+
+def test_dedup_keeps_mixed_types_distinct():
+    # 1, 1.0 and True hash equal but must keep their own formatting
+    x = np.tile(np.array([1, 1.0, True, 'a'], dtype=object), 1000)
+    res = nstring(x, case='upper')
+    assert list(res[:4]) == ['1', '1.0', 'TRUE', 'A']
+    assert list(res[-4:]) == ['1', '1.0', 'TRUE', 'A']
+
+def test_dedup_keeps_missing_values_distinct(monkeypatch):
+    # Heavily duplicated input goes through hash factorization; None and
+    # NaN must each map back to their own formatted value
+    from pyneatR import utils
+    calls = []
+    factorize = utils._factorize
+    monkeypatch.setattr(utils, "_factorize", lambda x: calls.append(x) or factorize(x))
+    
+    x = np.array(["a", None, np.nan, "b"] * 500, dtype=object)
+    res = nstring(x, case='lower')
+    assert calls, "nstring did not deduplicate its input"
+    assert list(res[:4]) == ["a", "none", "nan", "b"]
+    assert list(res[-4:]) == ["a", "none", "nan", "b"]
+    
+    nums = np.tile([1000.0, np.nan, -2500.0], 1000)
+    res_num = nnumber(nums)
+    assert list(res_num[:3]) == ["1.0 K", "nan", "-2.5 K"]
+
+def test_factorize_collapses_missing_values():
+    from pyneatR.utils import _factorize
+    # NaN floats share a single code
+    uvals, inverse = _factorize(np.tile([1.0, np.nan, np.nan, 2.0], 500))
+    assert len(uvals) == 3
+    assert np.isnan(uvals[inverse[1]]) and inverse[1] == inverse[2]
+    
+    # Object arrays keep one code per missing type, not per element
+    x = np.array(["a", None, np.nan, None, np.nan] * 500, dtype=object)
+    uvals, inverse = _factorize(x)
+    assert len(uvals) == 3
+    assert list(uvals[inverse[:5]]) == list(x[:5])
+
+def test_str_concat_keeps_interior_nuls():
+    from pyneatR.utils import _str_concat
+    res = _str_concat(np.array(['a\x00b', 'xy']), '!', np.array(['c', 'd\x00e']))
+    assert list(res) == ['a\x00b!c', 'xy!d\x00e']
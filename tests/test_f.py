@@ -3,14 +3,15 @@ import numpy as np
 import datetime
 from pyneatR import f
 
+DATES_2026 = np.array(['2026-01-01', '2026-01-02'], dtype='datetime64[D]')
+D0 = DATES_2026[0].item()  # datetime.date(2026, 1, 1), a Thursday
+
 def test_f_inference_date():
     # date inference
-    d = datetime.date(2026, 1, 1)
-    assert f(d) == "Jan 01, 2026"
+    assert f(D0) == "Jan 01, 2026"
     
     # numpy date inference
-    d_np = np.datetime64('2026-01-01', 'D')
-    assert f(d_np) == "Jan 01, 2026"
+    assert f(DATES_2026[0]) == "Jan 01, 2026"
 
 def test_f_inference_ts():
     # timestamp inference — no locale set, no timezone label injected
@@ -40,8 +41,7 @@ def test_f_inference_string():
     assert f(s) == "All Models Are Wrong"
 
 def test_f_day():
-    d = datetime.date(2026, 1, 1) # Thursday
-    assert f(d, format_type='day') == "Thu"
+    assert f(D0, format_type='day') == "Thu"
 
 def test_f_percent():
     # +900% (9x growth, 90K basis points)
@@ -64,9 +64,7 @@ def test_f_vectorized():
     assert res[0] == "1.0 K"
     assert res[1] == "2.0 K"
     
-    d = [datetime.date(2026, 1, 1), datetime.date(2026, 1, 2)]
-    # Convert to numpy array to ensure consistent inference in test
-    res_d = f(np.asanyarray(d, dtype='datetime64[D]'))
+    res_d = f(DATES_2026)
     assert res_d[0] == "Jan 01, 2026"
     assert res_d[1] == "Jan 02, 2026"
 
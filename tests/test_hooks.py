@@ -1,5 +1,4 @@
 import pandas as pd
-import polars as pl
 from pyneatR import neat_pandas, neat_polars
 from pyneatR.hooks import (
     _infer_column_type_pandas, _infer_column_type_polars,
@@ -53,23 +52,23 @@ class TestColumnInferencePandas:
 class TestColumnInferencePolars:
     """Test automatic column type inference for Polars."""
 
-    def test_numeric_column(self):
+    def test_numeric_column(self, pl):
         s = pl.Series("value", [1000, 2000, 3000])
         assert _infer_column_type_polars(s) == 'number'
 
-    def test_percent_by_name(self):
+    def test_percent_by_name(self, pl):
         s = pl.Series("conversion_rate", [0.1, 0.2, 0.3])
         assert _infer_column_type_polars(s) == 'percent'
 
-    def test_currency_by_name(self):
+    def test_currency_by_name(self, pl):
         s = pl.Series("revenue", [100.0, 200.0])
         assert _infer_column_type_polars(s) == 'currency'
 
-    def test_string_column(self):
+    def test_string_column(self, pl):
         s = pl.Series("description", ["hello", "world"])
         assert _infer_column_type_polars(s) == 'string'
 
-    def test_id_column_skip(self):
+    def test_id_column_skip(self, pl):
         s = pl.Series("user_id", [1, 2, 3])
         assert _infer_column_type_polars(s) == 'skip'
 
@@ -128,7 +127,7 @@ class TestNeatPolars:
     def teardown_method(self):
         reset_locale()
 
-    def test_basic_formatting(self):
+    def test_basic_formatting(self, pl):
         df = pl.DataFrame({
             "value": [1000, 2000000, 3000000000],
             "name": ["Alice", "Bob", "Charlie"],
@@ -137,7 +136,7 @@ class TestNeatPolars:
         # Should return a GT object
         assert hasattr(gt_obj, 'as_raw_html')
 
-    def test_explicit_column_types(self):
+    def test_explicit_column_types(self, pl):
         df = pl.DataFrame({
             "amount": [1000.0, 2000.0],
             "growth": [0.15, -0.05],
@@ -146,10 +146,15 @@ def test_npercent_extended():
         (0.05, "+5.00%", "(+500 bps)"),
     ]
 
-    for val, expected_pct, expected_bps in scenarios:
-        res = npercent([val], is_ratio=True, digits=2, show_bps=True, show_plus_sign=True)
-        assert expected_pct in res[0], f"Failed pct for {val}: got {res[0]}"
-        assert expected_bps in res[0], f"Failed bps for {val}: got {res[0]}"
+    vals = np.array([s[0] for s in scenarios], dtype=np.float64)
+    expected_pcts = np.array([s[1] for s in scenarios])
+    expected_bps = np.array([s[2] for s in scenarios])
+    out = npercent(vals, is_ratio=True, digits=2, show_bps=True, show_plus_sign=True)
+    
+    found_pct = np.char.find(out, expected_pcts) >= 0
+    found_bps = np.char.find(out, expected_bps) >= 0
+    assert found_pct.all(), f"Failed pct for {vals[~found_pct]}: got {out[~found_pct]}"
+    assert found_bps.all(), f"Failed bps for {vals[~found_bps]}: got {out[~found_bps]}"
 
     # Test plus_sign
     res_no_sign = npercent([0.05], is_ratio=True, show_plus_sign=False, digits=2)
@@ -187,6 +192,46 @@ def test_npercent_growth_factor_extended():
         (1000, "(1000.0x Growth)")
     ]
     
-    for val, expected in scenarios:
-        res = npercent([val], is_ratio=True, show_growth_factor=True)
-        assert expected in res[0], f"Failed for {val}: got {res[0]}, expected {expected}"
+    vals = np.array([s[0] for s in scenarios], dtype=np.float64)
+    expected = np.array([s[1] for s in scenarios])
+    out = npercent(vals, is_ratio=True, show_growth_factor=True)
+    
+    found = np.char.find(out, expected) >= 0
+    assert found.all(), f"Failed for {vals[~found]}: got {out[~found]}, expected {expected[~found]}"
+
+def test_nnumber_matches_python_format():
+    # Vectorized formatting must agree with Python's format spec
+    x = np.array([0.0, -0.04, 0.05, 0.125, 2.5, 999.95, 999999.5,
+                  -1234567.891, 1e15, np.nan, np.inf, -np.inf])
+    for digits in (0, 1, 2, 3):
+        res = nnumber(x, digits=digits, unit='')
+        expected = [f"{v:,.{digits}f}" for v in x]
+        assert list(res) == expected
+
+def test_display_dedup_matches_elementwise():
+    # Values sharing a rounded display value are formatted once; the result
+    # must match formatting each value on its own
+    x = np.array([0.1234, 0.1231, 0.1235, 0.12345, -0.0001, 0.0001, 0.0, -0.0,
+                  0.00125, 0.00135, np.nan] * 300)
+    res = npercent(x, digits=1)
+    assert list(res) == [npercent(np.array([v]), digits=1)[0] for v in x]
+    
+    y = np.array([1234.0, 1249.0, 1250.0, 1251.0, -0.01, -0.0, 0.0] * 300)
+    res = nnumber(y)
+    assert list(res) == [nnumber(np.array([v]))[0] for v in y]
+
+def test_nonfinite_values_skip_python_formatting(monkeypatch):
+    # nan/inf are rendered without per-element str.format, so a mostly-NaN
+    # input must not send every element down the slow path
+    from pyneatR import numbers
+    seen = []
+    format_py = numbers._format_fixed_py
+    monkeypatch.setattr(numbers, "_format_fixed_py",
+                        lambda vals, *args: seen.extend(vals) or format_py(vals, *args))
+    
+    x = np.array([np.nan] * 2000 + [np.inf, -np.inf, 1.5] * 100)
+    res_num = nnumber(x)
+    res_pct = npercent(x, show_plus_sign=True, show_bps=True)
+    assert len(seen) <= 5
+    assert list(res_num[[0, 2000, 2001, 2002]]) == ["nan", "inf", "-inf", "1.5"]
+    assert list(res_pct[[0, 2000, 2001]]) == ["nan% (+nan bps)", "+inf% (+inf bps)", "-inf% (-inf bps)"]
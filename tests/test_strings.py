@@ -57,3 +57,44 @@ def test_nstring_scalars():
     # Logic: space_pattern.sub(" ", s).strip() is applied
     assert res == "SCALAR INPUT"
 
+
+BACKEND_INPUT = ["Hello @World! 123", "  tEst  CasE ", "they're a1b\tc", "x-y_z", "", "\x1cA\x1fb", "abc\x00def"]
+BACKEND_OPTIONS = [
+    {'case': 'title', 'remove_specials': True},
+    {'case': 'start', 'ascii_only': True},
+    {'case': 'initcap', 'ascii_only': True},
+    {'case': 'upper', 'remove_specials': True, 'keep_chars': '!-'},
+    {'case': 'lower'},
+]
+# module to require, size threshold to lower, loader of the backend
+BACKENDS = {
+    'pyarrow': ("pyarrow", "_PYARROW_MIN_SIZE", "_load_pyarrow"),
+    'numba': ("numba", "_NUMBA_MIN_SIZE", "_load_numba_kernel"),
+}
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_nstring_backend_matches_regex_path(monkeypatch, backend):
+    module, min_size, _ = BACKENDS[backend]
+    pytest.importorskip(module)
+    from pyneatR import strings
+    
+    # Only the backend under test is allowed to run
+    for other, (_, _, loader) in BACKENDS.items():
+        if other != backend:
+            monkeypatch.setattr(strings, loader, lambda: None)
+    monkeypatch.setattr(strings, min_size, 0)
+    backend_res = [nstring(BACKEND_INPUT, **kw) for kw in BACKEND_OPTIONS]
+    
+    for _, _, loader in BACKENDS.values():
+        monkeypatch.setattr(strings, loader, lambda: None)
+    for kw, res in zip(BACKEND_OPTIONS, backend_res):
+        assert list(res) == list(nstring(BACKEND_INPUT, **kw))
+
+def test_nstring_no_options_returns_strings_unchanged():
+    x = ["  keep   spacing ", 123, None]
+    res = nstring(x)
+    assert list(res) == ["  keep   spacing ", "123", "None"]
+    assert nstring(" scalar ") == " scalar "
+    # numpy scalars render like the same value inside an array
+    for v in (np.float32(0.1), np.datetime64('2020-01-02T01:02:03')):
+        assert nstring(v) == nstring(np.array([v]))[0] == str(v)